@@ -1,15 +1,56 @@
-import json
+import ast
 import os
+import re
+from functools import lru_cache
+from typing import IO
 
 import yaml
 
+# Matches the appUrl value in fec.config.js: either a bracketed array or a
+# quoted string. Compiled once at import so every parse is a single scan.
+_APP_URL_RE = re.compile(r"appUrl\s*:\s*(\[[^\]]*\]|'[^']*'|\"[^\"]*\")")
 
-def get_app_url_from_fec_config(config_path: str = "fec.config.js") -> list[str] | None:
+
+def _load_frontend_yaml(yaml_path: str) -> dict:
+    """
+    Read and parse a frontend.yaml file, caching the result by (path, mtime).
+
+    All the frontend.yaml extraction functions route through this helper so
+    that repeated extractions against the same unmodified file (as happens in
+    a single run_plumber invocation) parse the YAML only once.
+
+    Args:
+        yaml_path: Path to the frontend.yaml file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        FileNotFoundError: If frontend.yaml is not found
+        ValueError: If the YAML cannot be parsed
+    """
+    if not os.path.exists(yaml_path):
+        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
+
+    return _load_frontend_yaml_cached(yaml_path, os.stat(yaml_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_frontend_yaml_cached(yaml_path: str, mtime_ns: int) -> dict:
+    with open(yaml_path) as f:
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse YAML file: {e}")
+
+
+def get_app_url_from_fec_config(config_path: str | IO[str] = "fec.config.js") -> list[str] | None:
     """
-    Extract the appUrl from fec.config.js file.
+    Extract the appUrl from fec.config.js content.
 
     Args:
-        config_path: Path to the fec.config.js file (default: "fec.config.js")
+        config_path: Path to the fec.config.js file, or a file-like object
+            containing the config source (default: "fec.config.js")
 
     Returns:
         The appUrl value from fec.config.js as a list, or None if not found.
@@ -18,57 +59,43 @@ def get_app_url_from_fec_config(config_path: str = "fec.config.js") -> list[str]
     Raises:
         FileNotFoundError: If fec.config.js is not found
     """
+    # Accept an already-open stream (e.g. io.StringIO) without touching disk
+    if hasattr(config_path, "read"):
+        return _parse_app_url(config_path.read())
+
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"fec.config.js not found at: {config_path}")
 
-    # Read the file
-    with open(config_path) as f:
-        content = f.read()
+    # Cached by (path, mtime) like _load_frontend_yaml, so repeated reads of
+    # the same unmodified file parse it only once
+    return _get_app_url_from_fec_config_cached(config_path, os.stat(config_path).st_mtime_ns)
 
-    # Find appUrl: pattern
-    start_marker = "appUrl:"
-    start = content.find(start_marker)
-    if start == -1:
-        return None
 
-    # Skip past "appUrl:" and any whitespace
-    value_start = start + len(start_marker)
-    value_start_content = content[value_start:].lstrip()
+@lru_cache(maxsize=32)
+def _get_app_url_from_fec_config_cached(config_path: str, mtime_ns: int) -> list[str] | None:
+    with open(config_path) as f:
+        return _parse_app_url(f.read())
 
-    # Check if it's an array or a string
-    if value_start_content.startswith("["):
-        # Handle array case: appUrl: [ ... ]
-        bracket_start = content.find("[", start)
-        bracket_end = content.find("]", bracket_start)
-        if bracket_end == -1:
-            return None
 
-        # Extract the array content and convert to valid JSON
-        array_content = content[bracket_start : bracket_end + 1]
-        # Replace single quotes with double quotes for JSON compatibility
-        array_content = array_content.replace("'", '"')
-        # Remove trailing commas (JavaScript allows them, JSON doesn't)
-        import re
-
-        array_content = re.sub(r",(\s*])", r"\1", array_content)
-        return json.loads(array_content)
-
-    elif value_start_content.startswith("'") or value_start_content.startswith('"'):
-        # Handle string case: appUrl: '/some/path' or appUrl: "/some/path"
-        quote_char = value_start_content[0]
-        string_start = content.find(quote_char, value_start)
-        string_end = content.find(quote_char, string_start + 1)
-        if string_end == -1:
-            return None
+def _parse_app_url(content: str) -> list[str] | None:
+    match = _APP_URL_RE.search(content)
+    if match is None:
+        # appUrl missing, or not an array/string literal
+        return None
 
-        # Extract the string value
-        url_value = content[string_start + 1 : string_end]
-        # Return as a single-element list
-        return [url_value]
+    value = match.group(1)
+    if value.startswith("["):
+        # Array case: ast.literal_eval accepts the JavaScript-isms that
+        # json.loads rejects (single quotes, trailing commas). Arrays that
+        # still aren't Python literals (comments, identifiers like
+        # process.env.X) are treated as "no appUrl found".
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return None
 
-    else:
-        # Unknown format
-        return None
+    # String case: appUrl: '/some/path' — return as a single-element list
+    return [value[1:-1]]
 
 
 def get_proxy_routes_from_frontend_yaml(
@@ -94,15 +121,7 @@ def get_proxy_routes_from_frontend_yaml(
     Raises:
         FileNotFoundError: If frontend.yaml is not found
     """
-    if not os.path.exists(yaml_path):
-        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
-
-    # Read and parse the YAML file
-    with open(yaml_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}")
+    data = _load_frontend_yaml(yaml_path)
 
     paths = []
 
@@ -178,15 +197,7 @@ def get_chrome_routes_from_frontend_yaml(
     Raises:
         FileNotFoundError: If frontend.yaml is not found
     """
-    if not os.path.exists(yaml_path):
-        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
-
-    # Read and parse the YAML file
-    with open(yaml_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}")
+    data = _load_frontend_yaml(yaml_path)
 
     paths = []
 
@@ -245,15 +256,7 @@ def get_app_url_from_frontend_yaml(yaml_path: str = "deploy/frontend.yaml") -> l
     Raises:
         FileNotFoundError: If frontend.yaml is not found
     """
-    if not os.path.exists(yaml_path):
-        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
-
-    # Read and parse the YAML file
-    with open(yaml_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}")
+    data = _load_frontend_yaml(yaml_path)
 
     paths = []
 
@@ -366,15 +369,7 @@ def is_federated_module(yaml_path: str = "deploy/frontend.yaml") -> bool:
     Raises:
         FileNotFoundError: If frontend.yaml is not found
     """
-    if not os.path.exists(yaml_path):
-        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
-
-    # Read and parse the YAML file
-    with open(yaml_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}")
+    data = _load_frontend_yaml(yaml_path)
 
     # Navigate to the Frontend spec
     if "objects" in data and isinstance(data["objects"], list):
@@ -407,15 +402,7 @@ def get_module_name_from_frontend_yaml(yaml_path: str = "deploy/frontend.yaml")
     Raises:
         FileNotFoundError: If frontend.yaml is not found
     """
-    if not os.path.exists(yaml_path):
-        raise FileNotFoundError(f"frontend.yaml not found at: {yaml_path}")
-
-    # Read and parse the YAML file
-    with open(yaml_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}")
+    data = _load_frontend_yaml(yaml_path)
 
     # Navigate to the Frontend object
     if "objects" in data and isinstance(data["objects"], list):
@@ -1,20 +1,58 @@
+import hashlib
 import os
 import subprocess
 import sys
+from functools import cache
 
 from jinja2 import Environment, FileSystemLoader
 
 
+@cache
+def _get_template(template_path: str):
+    """
+    Load and compile a Jinja2 template, cached per template path.
+
+    Repeated generate_* calls reuse the compiled template instead of
+    re-reading and re-compiling it from disk on every render.
+
+    Args:
+        template_path: Path to the Jinja2 template file
+
+    Returns:
+        The compiled jinja2.Template
+    """
+    template_dir = os.path.dirname(template_path)
+    template_file = os.path.basename(template_path)
+    env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+    return env.get_template(template_file)
+
+
+# Content digests that already passed validation in this process, so
+# re-validating an identical file skips the yamllint subprocess.
+_validated_digests: set[str] = set()
+
+
 def validate_yaml_file(file_path: str) -> None:
     """
     Validate a YAML file using yamllint.
 
+    Successful validations are cached by content hash, so regenerating a
+    ConfigMap with identical content (common across repeated runs and in
+    tests) does not spawn yamllint again.
+
     Args:
         file_path: Path to the YAML file to validate
 
     Raises:
         SystemExit: If yamllint validation fails
     """
+    with open(file_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    if digest in _validated_digests:
+        print(f"✅ YAML validation passed (cached): {file_path}")
+        return
+
     try:
         result = subprocess.run(
             ["yamllint", "-d", "relaxed", file_path],
@@ -29,6 +67,7 @@ def validate_yaml_file(file_path: str) -> None:
             print(result.stderr, file=sys.stderr)
             sys.exit(1)
 
+        _validated_digests.add(digest)
         print(f"✅ YAML validation passed: {file_path}")
 
     except FileNotFoundError:
@@ -53,11 +92,8 @@ def generate_proxy_routes_caddyfile(
     Returns:
         Caddyfile configuration snippets as a string
     """
-    # Set up Jinja2 environment
-    template_dir = os.path.dirname(template_path)
-    template_file = os.path.basename(template_path)
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template(template_file)
+    # Fetch the compiled template (cached per path)
+    template = _get_template(template_path)
 
     # Render the template with asset routes
     rendered = template.render(
@@ -106,38 +142,78 @@ data:
     return configmap
 
 
-def generate_proxy_caddy_configmap(
+def render_proxy_caddy_configmap(
     configmap_name: str,
     asset_routes: list[str],
     app_port: str = "8000",
     namespace: str | None = None,
+    template_dir: str | None = None,
 ) -> str:
     """
-    Generate proxy routes Caddyfile and wrap it in a ConfigMap YAML.
+    Render the proxy routes Caddyfile wrapped in a ConfigMap YAML.
 
     Args:
         configmap_name: Name for the ConfigMap
         asset_routes: List of asset paths that route to local app
         app_port: Port for the application (default: "8000")
         namespace: Optional namespace for the ConfigMap
+        template_dir: Directory containing the templates (default: "template")
 
     Returns:
-        Path to the generated ConfigMap YAML file
+        ConfigMap YAML as a string
     """
+    # Resolve the template path (cwd-relative "template" by default)
+    if template_dir is not None:
+        template_path = os.path.join(template_dir, "proxy_caddy.template.j2")
+    else:
+        template_path = "template/proxy_caddy.template.j2"
+
     # Generate the proxy routes Caddyfile
     proxy_caddyfile = generate_proxy_routes_caddyfile(
         asset_routes=asset_routes,
         app_port=app_port,
+        template_path=template_path,
     )
 
     # Wrap in ConfigMap with "routes" as the data key
-    configmap_yaml = generate_configmap(
+    return generate_configmap(
         configmap_name, proxy_caddyfile, namespace=namespace, data_key="routes"
     )
 
+
+def generate_proxy_caddy_configmap(
+    configmap_name: str,
+    asset_routes: list[str],
+    app_port: str = "8000",
+    namespace: str | None = None,
+    output_dir: str | None = None,
+    template_dir: str | None = None,
+) -> str:
+    """
+    Render the proxy Caddy ConfigMap and write it to disk.
+
+    Args:
+        configmap_name: Name for the ConfigMap
+        asset_routes: List of asset paths that route to local app
+        app_port: Port for the application (default: "8000")
+        namespace: Optional namespace for the ConfigMap
+        output_dir: Directory to write the ConfigMap to (default: current directory)
+        template_dir: Directory containing the templates (default: "template")
+
+    Returns:
+        Path to the generated ConfigMap YAML file
+    """
+    configmap_yaml = render_proxy_caddy_configmap(
+        configmap_name=configmap_name,
+        asset_routes=asset_routes,
+        app_port=app_port,
+        namespace=namespace,
+        template_dir=template_dir,
+    )
+
     # Write to file
     output_filename = f"{configmap_name}.yaml"
-    output_path = os.path.join(os.getcwd(), output_filename)
+    output_path = os.path.join(output_dir if output_dir else os.getcwd(), output_filename)
 
     with open(output_path, "w") as f:
         f.write(configmap_yaml)
@@ -1,5 +1,4 @@
 import argparse
-import json
 
 from extraction import (
     get_app_url_from_fec_config,
@@ -18,6 +17,8 @@ def run_plumber(
     fec_config_path: str = "fec.config.js",
     frontend_yaml_path: str = "deploy/frontend.yaml",
     namespace: str | None = None,
+    output_dir: str | None = None,
+    template_dir: str | None = None,
 ):
     print("Hello from plumber!")
     print(f"App Name (from CLI): {app_name}")
@@ -73,7 +74,7 @@ def run_plumber(
             app_url_value = get_app_url_from_fec_config(fec_config_path)
             if app_url_value:
                 print(f"Found appUrl in {fec_config_path}: {app_url_value}")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except FileNotFoundError as e:
             print(f"Warning: Could not read {fec_config_path} ({e}), using default routes")
 
     # Use default if neither file provided paths
@@ -105,6 +106,8 @@ def run_plumber(
         asset_routes=asset_routes,
         app_port=app_port,
         namespace=namespace,
+        output_dir=output_dir,
+        template_dir=template_dir,
     )
     print(f"✓ Generated proxy Caddy ConfigMap: {proxy_configmap_path}")
 
@@ -0,0 +1,28 @@
+import os
+import shutil
+
+import pytest
+
+# Repository root (the directory containing template/, main.py, etc.)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def staged_template_dir(tmp_path_factory):
+    """
+    Session-scoped directory with the template/ directory staged once.
+
+    Tests that invoke run_plumber pass staged_template_dir / "template" as
+    template_dir, so no test has to mutate the process-global cwd and the
+    suite stays safe for parallel execution. The templates are read-only,
+    so a symlink avoids copying the whole directory; falls back to a real
+    copy on platforms where symlinks are unavailable (e.g. Windows without
+    symlink privilege).
+    """
+    root = tmp_path_factory.mktemp("plumber-workdir")
+    source = os.path.join(REPO_ROOT, "template")
+    try:
+        os.symlink(source, root / "template", target_is_directory=True)
+    except OSError:
+        shutil.copytree(source, root / "template")
+    return root
@@ -1,90 +1,63 @@
 import os
-import tempfile
+import re
+from functools import cache
 
-import yaml
+import pytest
 
-from generation import generate_proxy_caddy_configmap
+from generation import generate_proxy_caddy_configmap, render_proxy_caddy_configmap
 
 
-def test_generate_proxy_caddy_configmap():
-    """Test that proxy Caddy ConfigMap is generated correctly."""
-    test_configmap_name = "test-proxy-caddy"
-    test_asset_routes = ["/settings/test-app", "/apps/test-app"]
+def _load(stream):
+    """
+    Parse YAML with the libyaml-backed loader when available.
 
-    # Generate the ConfigMap
-    output_path = generate_proxy_caddy_configmap(
-        configmap_name=test_configmap_name,
-        asset_routes=test_asset_routes,
-        app_port="8000",
-    )
+    PyYAML is imported lazily so test collection (and tests that never
+    parse YAML) skip the libyaml import cost entirely.
+    """
+    import yaml
 
     try:
-        # Verify the output file exists
-        assert os.path.exists(output_path), f"Output file not created at {output_path}"
-
-        # Read and parse the YAML
-        with open(output_path) as f:
-            configmap_content = f.read()
-
-        # Parse YAML
-        configmap = yaml.safe_load(configmap_content)
-
-        # Verify ConfigMap structure
-        assert configmap is not None, "ConfigMap parsed to None"
-        assert configmap.get("apiVersion") == "v1", "Invalid apiVersion"
-        assert configmap.get("kind") == "ConfigMap", "Invalid kind"
-
-        # Verify metadata
-        metadata = configmap.get("metadata", {})
-        assert metadata.get("name") == test_configmap_name, "Invalid ConfigMap name"
-
-        # Verify data section - proxy uses "routes" as the key
-        data = configmap.get("data", {})
-        assert "routes" in data, "routes key not found in data"
-
-        routes_content = data["routes"]
-
-        # Verify asset routes go to localhost
-        assert "handle /apps/test-app*" in routes_content
-        assert "handle /settings/test-app*" in routes_content
-        assert "reverse_proxy 127.0.0.1:8000" in routes_content
-
-    finally:
-        # Clean up
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-
-def test_configmap_names_are_respected():
-    """Test that ConfigMap names are correctly set."""
-    proxy_configmap_name = "custom-proxy-config"
-    test_asset_routes = ["/apps/my-app"]
-
-    # Generate proxy ConfigMap
-    proxy_path = generate_proxy_caddy_configmap(
-        configmap_name=proxy_configmap_name,
-        asset_routes=test_asset_routes,
-    )
+        from yaml import CSafeLoader as loader
+    except ImportError:  # libyaml bindings not available
+        from yaml import SafeLoader as loader
+
+    return yaml.load(stream, Loader=loader)
+
+
+@pytest.fixture(scope="module")
+def proxy_cm_factory(tmp_path_factory):
+    """
+    Module-scoped factory that generates and parses proxy ConfigMaps.
+
+    Results are memoized per (name, routes, namespace), so repeated
+    requests for the same ConfigMap render and parse it exactly once.
+    Outputs land in a module temp dir that pytest cleans up in bulk.
+    """
+    output_dir = tmp_path_factory.mktemp("proxy-cms")
+
+    @cache
+    def _build(configmap_name, asset_routes, namespace=None):
+        path = generate_proxy_caddy_configmap(
+            configmap_name=configmap_name,
+            asset_routes=asset_routes,
+            namespace=namespace,
+            output_dir=str(output_dir),
+        )
+        # Single binary read; the loader handles UTF-8 itself
+        with open(path, "rb") as f:
+            return path, _load(f.read())
 
-    try:
-        # Verify file name matches
-        assert proxy_path.endswith(f"{proxy_configmap_name}.yaml")
+    return _build
 
-        # Verify ConfigMap metadata name
-        with open(proxy_path) as f:
-            proxy_configmap = yaml.safe_load(f)
-        assert proxy_configmap["metadata"]["name"] == proxy_configmap_name
 
-    finally:
-        # Clean up
-        if os.path.exists(proxy_path):
-            os.remove(proxy_path)
+# Syntax that must never appear in rendered routes: unsubstituted Jinja2
+# variables/blocks and Caddy/Go-template env placeholders. Compiled once so
+# every test checks all forbidden patterns with a single scan.
+_FORBIDDEN_SYNTAX = re.compile(r"\{\{|\{%|\{env\.|\{\.Env\.")
 
-
-def test_configmap_integration_with_fec_config():
-    """Integration test that generates ConfigMap using fec.config.js."""
-    # Create a test fec.config.js file
-    test_fec_content = """const path = require('path');
+# Fixture file contents used by the tests below. Hoisted to module scope so
+# the literals are built once at import time.
+FEC_CONFIG_INTEGRATION = """const path = require('path');
 
 module.exports = {
   appUrl: [
@@ -96,186 +69,13 @@ module.exports = {
 };
 """
 
-    # Create temporary fec.config.js
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".js", delete=False, prefix="fec.config"
-    ) as temp_fec:
-        temp_fec.write(test_fec_content)
-        fec_config_path = temp_fec.name
-
-    try:
-        proxy_configmap_name = "integration-proxy-caddy"
-
-        # Import the function that uses fec config
-        from extraction import get_app_url_from_fec_config
-
-        # Get app URLs from fec config
-        app_urls = get_app_url_from_fec_config(fec_config_path)
-        assert app_urls is not None, "Failed to parse fec.config.js"
-        assert len(app_urls) == 3, f"Expected 3 URLs, got {len(app_urls)}"
-
-        # Generate proxy ConfigMap
-        proxy_path = generate_proxy_caddy_configmap(
-            configmap_name=proxy_configmap_name,
-            asset_routes=app_urls,
-        )
-
-        # Verify proxy ConfigMap
-        with open(proxy_path) as f:
-            proxy_configmap = yaml.safe_load(f)
-        assert proxy_configmap is not None
-        assert proxy_configmap["kind"] == "ConfigMap"
-
-        # Verify fec config URLs made it into the config
-        proxy_data = proxy_configmap["data"]["routes"]  # Proxy uses "routes" key
-        assert "handle /settings/test-app*" in proxy_data
-
-        # Clean up
-        os.remove(proxy_path)
-
-    finally:
-        # Clean up temp fec config
-        if os.path.exists(fec_config_path):
-            os.remove(fec_config_path)
-
-
-def test_configmap_with_namespace():
-    """Test that namespace is correctly added to ConfigMap."""
-    proxy_configmap_name = "namespace-proxy-caddy"
-    test_namespace = "hcc-platex-services-tenant"
-    test_app_urls = ["/namespace-test-app"]
-
-    # Generate proxy ConfigMap with namespace
-    proxy_path = generate_proxy_caddy_configmap(
-        configmap_name=proxy_configmap_name,
-        asset_routes=test_app_urls,
-        namespace=test_namespace,
-    )
-
-    try:
-        # Verify proxy ConfigMap has namespace
-        with open(proxy_path) as f:
-            proxy_configmap = yaml.safe_load(f)
-        assert proxy_configmap["metadata"]["name"] == proxy_configmap_name
-        assert proxy_configmap["metadata"]["namespace"] == test_namespace
-
-        # Verify proxy uses "routes" key
-        assert "routes" in proxy_configmap["data"]
-
-    finally:
-        # Clean up
-        if os.path.exists(proxy_path):
-            os.remove(proxy_path)
-
-
-def test_fallback_from_frontend_yaml_to_fec_config(tmp_path):
-    """Test that when frontend.yaml is missing, it falls back to fec.config.js."""
-    import shutil
-
-    test_app_name = "fallback-app"
-
-    # Create a test fec.config.js file
-    test_fec_content = """module.exports = {
+FEC_CONFIG_FALLBACK = """module.exports = {
   appUrl: ['/fallback-app', '/settings/fallback-app'],
   debug: true,
 };
 """
 
-    # Create temporary fec.config.js
-    fec_config_path = tmp_path / "fec.config.js"
-    fec_config_path.write_text(test_fec_content)
-
-    # Import the main function
-    from main import run_plumber
-
-    # Use a non-existent frontend.yaml path to trigger fallback
-    nonexistent_yaml = str(tmp_path / "nonexistent_frontend.yaml")
-
-    # Save current directory and change to tmp_path
-    original_dir = os.getcwd()
-    try:
-        # Copy template directory to tmp_path so templates can be found
-        shutil.copytree(os.path.join(original_dir, "template"), tmp_path / "template")
-
-        os.chdir(tmp_path)
-
-        # Run plumber with missing frontend.yaml but valid fec.config.js
-        run_plumber(
-            app_name=test_app_name,
-            repo_url="https://github.com/test/repo",
-            proxy_configmap_name="fallback-proxy-caddy",
-            fec_config_path=str(fec_config_path),
-            frontend_yaml_path=nonexistent_yaml,
-        )
-
-        # Verify the generated ConfigMap uses fec.config.js values
-        proxy_path = tmp_path / "fallback-proxy-caddy.yaml"
-        assert proxy_path.exists(), "Proxy ConfigMap should be generated"
-
-        # Parse and verify proxy ConfigMap contains routes from fec.config.js
-        proxy_configmap = yaml.safe_load(proxy_path.read_text())
-        proxy_data = proxy_configmap["data"]["routes"]
-        assert "handle /fallback-app*" in proxy_data
-        assert "handle /settings/fallback-app*" in proxy_data
-
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
-
-
-def test_fallback_to_default_when_both_missing(tmp_path):
-    """Test that when both frontend.yaml and fec.config.js are missing, default routes are used."""
-    import shutil
-
-    test_app_name = "default-routes-app"
-
-    # Import the main function
-    from main import run_plumber
-
-    # Use non-existent paths for both files
-    nonexistent_yaml = str(tmp_path / "nonexistent_frontend.yaml")
-    nonexistent_fec = str(tmp_path / "nonexistent_fec.config.js")
-
-    # Save current directory and change to tmp_path
-    original_dir = os.getcwd()
-    try:
-        # Copy template directory to tmp_path so templates can be found
-        shutil.copytree(os.path.join(original_dir, "template"), tmp_path / "template")
-
-        os.chdir(tmp_path)
-
-        # Run plumber with both files missing
-        run_plumber(
-            app_name=test_app_name,
-            repo_url="https://github.com/test/repo",
-            proxy_configmap_name="default-proxy-caddy",
-            fec_config_path=nonexistent_fec,
-            frontend_yaml_path=nonexistent_yaml,
-        )
-
-        # Verify the generated ConfigMap uses default routes
-        proxy_path = tmp_path / "default-proxy-caddy.yaml"
-        assert proxy_path.exists(), "Proxy ConfigMap should be generated"
-
-        # Parse and verify proxy ConfigMap contains default route
-        proxy_configmap = yaml.safe_load(proxy_path.read_text())
-        proxy_data = proxy_configmap["data"]["routes"]
-        # Default route should be /{app_name}
-        assert f"handle /{test_app_name}*" in proxy_data
-
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
-
-
-def test_frontend_yaml_takes_precedence_over_fec_config(tmp_path):
-    """Test that when both frontend.yaml and fec.config.js exist, frontend.yaml takes precedence."""
-    import shutil
-
-    test_app_name = "precedence-app"
-
-    # Create a test frontend.yaml with specific paths
-    frontend_yaml_content = """apiVersion: template.openshift.io/v1
+FRONTEND_YAML_PRECEDENCE = """apiVersion: template.openshift.io/v1
 kind: Template
 metadata:
   name: test-template
@@ -291,69 +91,12 @@ objects:
           - /yaml-path-2
 """
 
-    # Create a test fec.config.js with different paths
-    fec_config_content = """module.exports = {
+FEC_CONFIG_PRECEDENCE = """module.exports = {
   appUrl: ['/fec-path-1', '/fec-path-2'],
 };
 """
 
-    # Create temporary files
-    yaml_path = tmp_path / "frontend.yaml"
-    yaml_path.write_text(frontend_yaml_content)
-
-    fec_path = tmp_path / "fec.config.js"
-    fec_path.write_text(fec_config_content)
-
-    # Import the main function
-    from main import run_plumber
-
-    # Save current directory and change to tmp_path
-    original_dir = os.getcwd()
-    try:
-        # Copy template directory to tmp_path so templates can be found
-        shutil.copytree(os.path.join(original_dir, "template"), tmp_path / "template")
-
-        os.chdir(tmp_path)
-
-        # Run plumber with both files present
-        run_plumber(
-            app_name=test_app_name,
-            repo_url="https://github.com/test/repo",
-            proxy_configmap_name="precedence-proxy-caddy",
-            fec_config_path=str(fec_path),
-            frontend_yaml_path=str(yaml_path),
-        )
-
-        # Verify the generated ConfigMap uses frontend.yaml values (not fec.config.js)
-        proxy_path = tmp_path / "precedence-proxy-caddy.yaml"
-
-        assert proxy_path.exists(), "Proxy ConfigMap should be generated"
-
-        # Parse and verify proxy ConfigMap contains routes from frontend.yaml
-        proxy_configmap = yaml.safe_load(proxy_path.read_text())
-        proxy_data = proxy_configmap["data"]["routes"]
-
-        # Should contain yaml paths
-        assert "handle /yaml-path-1*" in proxy_data
-        assert "handle /yaml-path-2*" in proxy_data
-
-        # Should NOT contain fec.config.js paths
-        assert "/fec-path-1" not in proxy_data
-        assert "/fec-path-2" not in proxy_data
-
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
-
-
-def test_frontend_yaml_extracts_navigation_routes(tmp_path):
-    """Test that navigation routes are extracted but NOT included in proxy ConfigMap."""
-    import shutil
-
-    test_app_name = "rbac"
-
-    # Create a frontend.yaml with navigation routes similar to insights-rbac-ui
-    frontend_yaml_content = """apiVersion: v1
+FRONTEND_YAML_RBAC = """apiVersion: v1
 kind: Template
 metadata:
   name: rbac-frontend
@@ -410,9 +153,283 @@ objects:
               - pathname: /iam
 """
 
+# Pre-encoded fixture bytes for _write_bytes, encoded once at import time.
+FEC_CONFIG_FALLBACK_BYTES = FEC_CONFIG_FALLBACK.encode()
+FRONTEND_YAML_PRECEDENCE_BYTES = FRONTEND_YAML_PRECEDENCE.encode()
+FEC_CONFIG_PRECEDENCE_BYTES = FEC_CONFIG_PRECEDENCE.encode()
+FRONTEND_YAML_RBAC_BYTES = FRONTEND_YAML_RBAC.encode()
+
+
+def _extract_routes_section(yaml_text: str) -> str:
+    """
+    Slice the literal block under 'routes: |' out of a generated ConfigMap.
+
+    The generated ConfigMaps have a fixed preamble, so assertion-only
+    lookups of the routes text can skip the full YAML parse. The
+    parametrized structural test remains the authoritative full-parse check.
+    """
+    marker = "  routes: |\n"
+    start = yaml_text.index(marker) + len(marker)
+    lines = []
+    for line in yaml_text[start:].splitlines():
+        if line and not line.startswith("    "):
+            break
+        lines.append(line[4:])
+    return "\n".join(lines)
+
+
+def _write_bytes(path, data: bytes) -> None:
+    """Write already-encoded fixture bytes, skipping the text codec layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Route fixtures shared by the generation tests; tuples so they are built
+# once at import time and stay immutable across test runs.
+_TEST_ASSET_ROUTES = ("/settings/test-app", "/apps/test-app")
+_NAME_TEST_ASSET_ROUTES = ("/apps/my-app",)
+_NAMESPACE_TEST_APP_URLS = ("/namespace-test-app",)
+
+# Paths that get_app_url_from_frontend_yaml should pull out of
+# FRONTEND_YAML_RBAC, across all of its extraction sources.
+_RBAC_EXPECTED_ALL_PATHS = frozenset(
+    {
+        "/apps/rbac",  # spec.frontend.paths
+        "/settings/rbac",  # spec.module.modules[].routes[].pathname
+        "/iam",  # spec.module.modules[].routes[].pathname
+        "/iam/user-access/users",  # searchEntries[].href / serviceTiles[].href
+        "/iam/user-access/groups",  # serviceTiles[].href
+        "/iam/user-access/overview",  # bundleSegments[].navItems[].href
+        "/iam/my-user-access",  # bundleSegments[].navItems[].href
+        "/iam/access-management/users-and-user-groups",  # navItems[].routes[].href
+        "/iam/access-management/roles",  # navItems[].routes[].href
+    }
+)
+
+# Of those, only the asset paths belong in the proxy routes.
+_RBAC_EXPECTED_PROXY_ROUTES = frozenset({"/apps/rbac", "/settings/rbac"})
+
+# Matches the path in a rendered "handle <path>* {" directive.
+_HANDLE_RE = re.compile(r"handle (\S+)\*")
+
+
+def _handled_routes(routes_text: str) -> set[str]:
+    """Extract the set of handled route paths from rendered Caddy routes."""
+    return set(_HANDLE_RE.findall(routes_text))
+
+
+@pytest.mark.parametrize(
+    "configmap_name,asset_routes,namespace,expected_substrings",
+    [
+        pytest.param(
+            "test-proxy-caddy",
+            _TEST_ASSET_ROUTES,
+            None,
+            (
+                "handle /apps/test-app*",
+                "handle /settings/test-app*",
+                "reverse_proxy 127.0.0.1:8000",
+            ),
+            id="asset-routes",
+        ),
+        pytest.param(
+            "custom-proxy-config",
+            _NAME_TEST_ASSET_ROUTES,
+            None,
+            ("handle /apps/my-app*",),
+            id="custom-name",
+        ),
+        pytest.param(
+            "namespace-proxy-caddy",
+            _NAMESPACE_TEST_APP_URLS,
+            "hcc-platex-services-tenant",
+            ("handle /namespace-test-app*",),
+            id="namespace",
+        ),
+    ],
+)
+def test_generate_proxy_caddy_configmap(
+    proxy_cm_factory, configmap_name, asset_routes, namespace, expected_substrings
+):
+    """Test ConfigMap structure, naming, namespace handling, and routes."""
+    # Generate (or reuse) the ConfigMap via the memoized factory
+    output_path, configmap = proxy_cm_factory(configmap_name, asset_routes, namespace)
+
+    # Verify file name matches
+    assert output_path.endswith(f"{configmap_name}.yaml")
+
+    # Verify ConfigMap structure
+    assert configmap is not None, "ConfigMap parsed to None"
+    assert configmap.get("apiVersion") == "v1", "Invalid apiVersion"
+    assert configmap.get("kind") == "ConfigMap", "Invalid kind"
+
+    # Verify metadata, including the namespace when one was requested
+    metadata = configmap.get("metadata", {})
+    assert metadata.get("name") == configmap_name, "Invalid ConfigMap name"
+    if namespace:
+        assert metadata.get("namespace") == namespace, "Invalid namespace"
+    else:
+        assert "namespace" not in metadata, "Unexpected namespace in metadata"
+
+    # Verify data section - proxy uses "routes" as the key
+    data = configmap.get("data", {})
+    assert "routes" in data, "routes key not found in data"
+
+    routes_content = data["routes"]
+
+    # Verify asset routes go to localhost
+    for expected in expected_substrings:
+        assert expected in routes_content, f"{expected!r} not found in routes"
+
+    # Verify no template or env placeholder syntax leaked into the routes
+    assert not _FORBIDDEN_SYNTAX.search(routes_content), (
+        "Unsubstituted template syntax found in rendered routes"
+    )
+
+
+def test_configmap_integration_with_fec_config(tmp_path):
+    """Integration test that generates ConfigMap using fec.config.js."""
+    # Create temporary fec.config.js (cleaned up by pytest with tmp_path)
+    fec_config_path = tmp_path / "fec.config.js"
+    fec_config_path.write_text(FEC_CONFIG_INTEGRATION)
+
+    proxy_configmap_name = "integration-proxy-caddy"
+
+    # Import the function that uses fec config
+    from extraction import get_app_url_from_fec_config
+
+    # Get app URLs from fec config
+    app_urls = get_app_url_from_fec_config(str(fec_config_path))
+    assert app_urls is not None, "Failed to parse fec.config.js"
+    assert len(app_urls) == 3, f"Expected 3 URLs, got {len(app_urls)}"
+
+    # Render proxy ConfigMap in memory - no file round-trip needed here
+    raw = render_proxy_caddy_configmap(
+        configmap_name=proxy_configmap_name,
+        asset_routes=app_urls,
+    )
+
+    # Parse for structural checks, substring-match the raw text
+    proxy_configmap = _load(raw)
+    assert proxy_configmap is not None
+    assert proxy_configmap["kind"] == "ConfigMap"
+
+    # Verify fec config URLs made it into the config
+    assert "handle /settings/test-app*" in raw
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "app_name,configmap_name,fec_content,expected_routes",
+    [
+        pytest.param(
+            "fallback-app",
+            "fallback-proxy-caddy",
+            FEC_CONFIG_FALLBACK_BYTES,
+            ("/fallback-app", "/settings/fallback-app"),
+            id="fec-config-fallback",
+        ),
+        pytest.param(
+            "default-routes-app",
+            "default-proxy-caddy",
+            None,
+            ("/default-routes-app",),
+            id="default-routes",
+        ),
+    ],
+)
+def test_run_plumber_fallback_routes(
+    staged_template_dir, tmp_path, app_name, configmap_name, fec_content, expected_routes
+):
+    """
+    Test route fallbacks when frontend.yaml is missing.
+
+    With a valid fec.config.js, its appUrl values are used; with both
+    files missing, the default /{app_name} route is used.
+    """
+    # Stage fec.config.js when the case provides one, otherwise point at a
+    # non-existent file to trigger the default-route fallback
+    fec_config_path = tmp_path / "fec.config.js"
+    if fec_content is not None:
+        _write_bytes(fec_config_path, fec_content)
+
+    # Import the main function
+    from main import run_plumber
+
+    # Use a non-existent frontend.yaml path to trigger fallback
+    nonexistent_yaml = str(tmp_path / "nonexistent_frontend.yaml")
+
+    # Run plumber with missing frontend.yaml
+    run_plumber(
+        app_name=app_name,
+        repo_url="https://github.com/test/repo",
+        proxy_configmap_name=configmap_name,
+        fec_config_path=str(fec_config_path),
+        frontend_yaml_path=nonexistent_yaml,
+        output_dir=str(tmp_path),
+        template_dir=str(staged_template_dir / "template"),
+    )
+
+    # Verify the generated ConfigMap contains the fallback routes
+    proxy_path = tmp_path / f"{configmap_name}.yaml"
+    assert proxy_path.exists(), "Proxy ConfigMap should be generated"
+
+    handled = _handled_routes(_extract_routes_section(proxy_path.read_text()))
+    assert set(expected_routes) <= handled, (
+        f"Missing fallback routes: {sorted(set(expected_routes) - handled)}"
+    )
+
+
+@pytest.mark.slow
+def test_frontend_yaml_takes_precedence_over_fec_config(staged_template_dir, tmp_path):
+    """Test that when both frontend.yaml and fec.config.js exist, frontend.yaml takes precedence."""
+    test_app_name = "precedence-app"
+
+    # Create temporary files
+    yaml_path = tmp_path / "frontend.yaml"
+    _write_bytes(yaml_path, FRONTEND_YAML_PRECEDENCE_BYTES)
+
+    fec_path = tmp_path / "fec.config.js"
+    _write_bytes(fec_path, FEC_CONFIG_PRECEDENCE_BYTES)
+
+    # Import the main function
+    from main import run_plumber
+
+    # Run plumber with both files present
+    run_plumber(
+        app_name=test_app_name,
+        repo_url="https://github.com/test/repo",
+        proxy_configmap_name="precedence-proxy-caddy",
+        fec_config_path=str(fec_path),
+        frontend_yaml_path=str(yaml_path),
+        output_dir=str(tmp_path),
+        template_dir=str(staged_template_dir / "template"),
+    )
+
+    # Verify the generated ConfigMap uses frontend.yaml values (not fec.config.js)
+    proxy_path = tmp_path / "precedence-proxy-caddy.yaml"
+
+    assert proxy_path.exists(), "Proxy ConfigMap should be generated"
+
+    # Verify proxy ConfigMap contains routes from frontend.yaml
+    handled = _handled_routes(_extract_routes_section(proxy_path.read_text()))
+
+    # Should contain yaml paths but NOT fec.config.js paths
+    assert {"/yaml-path-1", "/yaml-path-2"} <= handled
+    assert handled.isdisjoint({"/fec-path-1", "/fec-path-2"})
+
+
+@pytest.mark.slow
+def test_frontend_yaml_extracts_navigation_routes(staged_template_dir, tmp_path):
+    """Test that navigation routes are extracted but NOT included in proxy ConfigMap."""
+    test_app_name = "rbac"
+
     # Create temporary frontend.yaml
     yaml_path = tmp_path / "frontend.yaml"
-    yaml_path.write_text(frontend_yaml_content)
+    _write_bytes(yaml_path, FRONTEND_YAML_RBAC_BYTES)
 
     # Import the extraction functions
     from extraction import get_app_url_from_frontend_yaml, get_proxy_routes_from_frontend_yaml
@@ -420,119 +437,72 @@ objects:
     # Extract all paths (for reference)
     all_paths = get_app_url_from_frontend_yaml(str(yaml_path))
 
-    # Verify all expected paths are extracted
+    # Verify all expected paths are extracted (one set comparison)
     assert all_paths is not None, "Should extract paths from frontend.yaml"
-    assert "/apps/rbac" in all_paths, "Should extract from spec.frontend.paths"
-    assert "/settings/rbac" in all_paths, (
-        "Should extract from spec.module.modules[].routes[].pathname"
-    )
-    assert "/iam" in all_paths, "Should extract from spec.module.modules[].routes[].pathname"
-    assert "/iam/user-access/users" in all_paths, "Should extract from searchEntries[].href"
-    assert "/iam/user-access/groups" in all_paths, "Should extract from serviceTiles[].href"
-    assert "/iam/user-access/overview" in all_paths, (
-        "Should extract from bundleSegments[].navItems[].href"
-    )
-    assert "/iam/my-user-access" in all_paths, (
-        "Should extract from bundleSegments[].navItems[].href"
-    )
-    assert "/iam/access-management/users-and-user-groups" in all_paths, (
-        "Should extract from bundleSegments[].navItems[].routes[].href"
-    )
-    assert "/iam/access-management/roles" in all_paths, (
-        "Should extract from bundleSegments[].navItems[].routes[].href"
+    all_paths_set = set(all_paths)
+    assert _RBAC_EXPECTED_ALL_PATHS <= all_paths_set, (
+        f"Missing extracted paths: {sorted(_RBAC_EXPECTED_ALL_PATHS - all_paths_set)}"
     )
 
     # Verify the paths are unique
-    assert len(all_paths) == len(set(all_paths)), "Paths should be unique"
+    assert len(all_paths) == len(all_paths_set), "Paths should be unique"
 
     # Extract proxy routes (asset paths only, not navigation routes)
     proxy_routes = get_proxy_routes_from_frontend_yaml(str(yaml_path))
 
-    # Verify proxy routes (asset routes) contain ONLY /apps/* and /settings/* paths
+    # Verify proxy routes (asset routes) contain ONLY /apps/* and /settings/* paths;
+    # Chrome shell bundle mounts (/iam) and navigation routes must be excluded
     assert proxy_routes is not None, "Should extract proxy routes"
-    assert "/apps/rbac" in proxy_routes, "Should include spec.frontend.paths"
-    assert "/settings/rbac" in proxy_routes, (
-        "Should include spec.module.modules[].routes (asset paths)"
-    )
-
-    # Verify /iam is NOT in asset routes (it's a Chrome shell bundle mount)
-    assert "/iam" not in proxy_routes, "Should exclude Chrome shell bundle mounts from asset routes"
-
-    # Verify navigation routes are NOT in proxy routes
-    assert "/iam/user-access/users" not in proxy_routes, "Should exclude searchEntries"
-    assert "/iam/user-access/groups" not in proxy_routes, "Should exclude serviceTiles"
-    assert "/iam/user-access/overview" not in proxy_routes, "Should exclude bundleSegments navItems"
-    assert "/iam/my-user-access" not in proxy_routes, "Should exclude bundleSegments navItems"
-    assert "/iam/access-management/users-and-user-groups" not in proxy_routes, (
-        "Should exclude bundleSegments navItems routes"
+    proxy_routes_set = set(proxy_routes)
+    assert _RBAC_EXPECTED_PROXY_ROUTES <= proxy_routes_set, (
+        f"Missing asset routes: {sorted(_RBAC_EXPECTED_PROXY_ROUTES - proxy_routes_set)}"
     )
-    assert "/iam/access-management/roles" not in proxy_routes, (
-        "Should exclude bundleSegments navItems routes"
+    non_asset_paths = _RBAC_EXPECTED_ALL_PATHS - _RBAC_EXPECTED_PROXY_ROUTES
+    assert proxy_routes_set.isdisjoint(non_asset_paths), (
+        "Chrome shell/navigation paths leaked into proxy routes: "
+        f"{sorted(proxy_routes_set & non_asset_paths)}"
     )
 
     # Verify proxy routes are fewer than all paths
     assert len(proxy_routes) < len(all_paths), "Proxy routes should be a subset of all paths"
 
     # Now verify the proxy ConfigMap only contains asset paths
-    original_dir = os.getcwd()
-    try:
-        # Copy template directory to tmp_path so templates can be found
-        shutil.copytree(os.path.join(original_dir, "template"), tmp_path / "template")
-
-        os.chdir(tmp_path)
-
-        from main import run_plumber
+    from main import run_plumber
 
-        # Generate ConfigMap
-        run_plumber(
-            app_name=test_app_name,
-            repo_url="https://github.com/test/repo",
-            proxy_configmap_name="rbac-proxy-caddy",
-            fec_config_path="nonexistent.js",
-            frontend_yaml_path=str(yaml_path),
-        )
+    # Generate ConfigMap
+    run_plumber(
+        app_name=test_app_name,
+        repo_url="https://github.com/test/repo",
+        proxy_configmap_name="rbac-proxy-caddy",
+        fec_config_path="nonexistent.js",
+        frontend_yaml_path=str(yaml_path),
+        output_dir=str(tmp_path),
+        template_dir=str(staged_template_dir / "template"),
+    )
 
-        # Verify proxy ConfigMap only contains asset paths
-        proxy_path = tmp_path / "rbac-proxy-caddy.yaml"
-        assert proxy_path.exists(), "Proxy ConfigMap should be generated"
+    # Verify proxy ConfigMap only contains asset paths
+    proxy_path = tmp_path / "rbac-proxy-caddy.yaml"
+    assert proxy_path.exists(), "Proxy ConfigMap should be generated"
 
-        proxy_configmap = yaml.safe_load(proxy_path.read_text())
-        proxy_data = proxy_configmap["data"]["routes"]
+    proxy_data = _extract_routes_section(proxy_path.read_text())
 
-        # Verify asset paths ARE in the proxy config and route to localhost
-        assert "handle /apps/rbac*" in proxy_data, "Should include /apps/rbac asset path"
-        assert "handle /settings/rbac*" in proxy_data, "Should include /settings/rbac asset path"
-        assert "reverse_proxy 127.0.0.1:8000" in proxy_data, (
-            "Asset routes should proxy to localhost"
-        )
+    # Extract every handled route in one regex pass and compare as sets
+    handled = _handled_routes(proxy_data)
 
-        # Verify Chrome shell routes are NOT in the proxy config
-        assert "handle /iam*" not in proxy_data, "Should NOT include /iam Chrome shell route"
-        assert "handle /apps/chrome*" not in proxy_data, "Should NOT include /apps/chrome route"
-        assert "handle /*" not in proxy_data and "handle / *" not in proxy_data, (
-            "Should NOT include / route"
-        )
+    # Asset paths must be handled and route to localhost
+    assert _RBAC_EXPECTED_PROXY_ROUTES <= handled, (
+        f"Missing expected asset routes: {sorted(_RBAC_EXPECTED_PROXY_ROUTES - handled)}"
+    )
+    assert "reverse_proxy 127.0.0.1:8000" in proxy_data, "Asset routes should proxy to localhost"
 
-        # Verify navigation routes are NOT in the proxy config
-        assert "handle /iam/user-access/users*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
-        assert "handle /iam/user-access/groups*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
-        assert "handle /iam/user-access/overview*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
-        assert "handle /iam/my-user-access*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
-        assert "handle /iam/access-management/users-and-user-groups*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
-        assert "handle /iam/access-management/roles*" not in proxy_data, (
-            "Should NOT include navigation route"
-        )
+    # Chrome shell mounts, standard Chrome routes, and navigation routes
+    # must NOT be handled by the proxy config
+    forbidden = (_RBAC_EXPECTED_ALL_PATHS - _RBAC_EXPECTED_PROXY_ROUTES) | {"/apps/chrome", "/"}
+    assert handled.isdisjoint(forbidden), (
+        f"Chrome shell/navigation routes leaked into proxy ConfigMap: {sorted(handled & forbidden)}"
+    )
 
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
+    # Verify no template or env placeholder syntax leaked into the routes
+    assert not _FORBIDDEN_SYNTAX.search(proxy_data), (
+        "Unsubstituted template syntax found in rendered routes"
+    )
@@ -1,37 +1,36 @@
-from generation import generate_proxy_routes_caddyfile
+import re
 
+import pytest
 
-def test_generate_proxy_routes_caddyfile():
-    """Test generating proxy routes Caddyfile from asset routes."""
-    asset_routes = [
-        "/apps/learning-resources",
-        "/settings/learning-resources",
-    ]
+from generation import generate_proxy_routes_caddyfile
 
-    result = generate_proxy_routes_caddyfile(asset_routes=asset_routes)
+# Keep these tests on one xdist worker so generation's compiled-template
+# cache warms up once instead of per worker
+pytestmark = pytest.mark.xdist_group("proxy_template")
 
-    # Verify the result is a string
-    assert isinstance(result, str)
+# Matches the route token of each "handle <route>*" block in a rendered Caddyfile
+_HANDLE_RE = re.compile(r"handle (\S+)\*")
 
-    # Verify asset routes go to localhost
-    assert "reverse_proxy 127.0.0.1:8000" in result
-    for route in asset_routes:
-        assert f"handle {route}*" in result
+# Route literals built once at import rather than per test invocation
+_LR_ASSET_ROUTES = ("/apps/learning-resources", "/settings/learning-resources")
+_MY_APP_ASSET_ROUTES = ("/apps/my-app", "/settings/my-app")
 
-    print("Generated Caddyfile:")
-    print(result)
 
+@pytest.mark.parametrize(
+    "asset_routes,app_port",
+    [
+        (_LR_ASSET_ROUTES, "8000"),
+        (_MY_APP_ASSET_ROUTES, "3000"),
+    ],
+    ids=["default-port", "custom-port"],
+)
+def test_generate_proxy_routes_caddyfile(asset_routes, app_port):
+    """Test generating proxy routes Caddyfile from asset routes."""
+    result = generate_proxy_routes_caddyfile(asset_routes=asset_routes, app_port=app_port)
 
-def test_generate_proxy_routes_caddyfile_custom_ports():
-    """Test with custom app port."""
-    asset_routes = ["/apps/my-app", "/settings/my-app"]
-
-    result = generate_proxy_routes_caddyfile(
-        asset_routes=asset_routes,
-        app_port="3000",
-    )
+    # Verify the result is a string
+    assert isinstance(result, str)
 
-    # Verify custom port is used for asset routes
-    assert "reverse_proxy 127.0.0.1:3000" in result
-    assert "handle /apps/my-app*" in result
-    assert "handle /settings/my-app*" in result
+    # Verify asset routes go to localhost on the requested port
+    assert f"reverse_proxy 127.0.0.1:{app_port}" in result
+    assert set(asset_routes) <= set(_HANDLE_RE.findall(result))
@@ -1,5 +1,4 @@
-import os
-import tempfile
+import io
 
 import pytest
 
@@ -7,53 +6,34 @@ from extraction import get_app_url_from_fec_config
 
 
 def test_get_app_url_from_fec_config():
-    """Test extracting appUrl from a valid fec.config.js file."""
-    # Create a temporary fec.config.js file with JavaScript syntax
+    """Test extracting appUrl from valid fec.config.js content."""
+    # fec.config.js content with JavaScript syntax, passed as an in-memory stream
     fec_config_content = """module.exports = {
   appUrl: ['/learning-resources', '/settings/learning-resources'],
   someOtherKey: 'value'
 };
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as temp_file:
-        temp_file.write(fec_config_content)
-        temp_path = temp_file.name
+    # Test the function
+    app_url = get_app_url_from_fec_config(io.StringIO(fec_config_content))
 
-    try:
-        # Test the function
-        app_url = get_app_url_from_fec_config(temp_path)
-
-        # Verify the result
-        assert app_url is not None, "appUrl should not be None"
-        assert isinstance(app_url, list), "appUrl should be a list"
-        assert "/learning-resources" in app_url
-        assert "/settings/learning-resources" in app_url
-
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+    # Verify the result
+    assert app_url is not None, "appUrl should not be None"
+    assert isinstance(app_url, list), "appUrl should be a list"
+    assert "/learning-resources" in app_url
+    assert "/settings/learning-resources" in app_url
 
 
 def test_get_app_url_missing_key():
     """Test that None is returned when appUrl is not present."""
-    # Create a fec.config.js without appUrl
+    # fec.config.js content without appUrl
     fec_config_content = """module.exports = {
   someOtherKey: 'value'
 };
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as temp_file:
-        temp_file.write(fec_config_content)
-        temp_path = temp_file.name
-
-    try:
-        app_url = get_app_url_from_fec_config(temp_path)
-        assert app_url is None
-
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+    app_url = get_app_url_from_fec_config(io.StringIO(fec_config_content))
+    assert app_url is None
 
 
 def test_get_app_url_file_not_found():
@@ -62,24 +42,18 @@ def test_get_app_url_file_not_found():
         get_app_url_from_fec_config("nonexistent_file.js")
 
 
-def test_get_app_url_default_path():
+def test_get_app_url_default_path(tmp_path, monkeypatch):
     """Test using the default path (current directory)."""
-    # Create fec.config.js in current directory
+    # Create fec.config.js in a throwaway cwd; pytest removes tmp_path in bulk
     fec_config_content = """module.exports = {
   appUrl: ['/my-app', '/settings/my-app']
 };
 """
-
-    with open("fec.config.js", "w") as f:
-        f.write(fec_config_content)
-
-    try:
-        app_url = get_app_url_from_fec_config()
-        assert app_url is not None, "appUrl should not be None"
-        assert isinstance(app_url, list), "appUrl should be a list"
-        assert "/my-app" in app_url
-        assert "/settings/my-app" in app_url
-
-    finally:
-        if os.path.exists("fec.config.js"):
-            os.remove("fec.config.js")
+    (tmp_path / "fec.config.js").write_text(fec_config_content)
+    monkeypatch.chdir(tmp_path)
+
+    app_url = get_app_url_from_fec_config()
+    assert app_url is not None, "appUrl should not be None"
+    assert isinstance(app_url, list), "appUrl should be a list"
+    assert "/my-app" in app_url
+    assert "/settings/my-app" in app_url